@@ -6,7 +6,8 @@ from flasgger import Swagger
 from flask import Flask
 
 from auth.route import auth_bp
-from database import create_db_command, db
+from auth.util import HS256JWTCodec
+from database import create_db_command, db, migrate_db_command
 from item.route import item_bp
 from static.route import static_bp
 from tag.route import tag_bp
@@ -24,10 +25,13 @@ def create_app(test_config: Mapping[str, Any] | None = None) -> Flask:
         app.config.from_mapping(test_config)
     # a random key for jwt encoding
     app.config["jwt_key"] = token_hex()
+    # built once and shared by all requests
+    app.extensions["jwt_codec"] = HS256JWTCodec(app.config["jwt_key"])
 
     _init_swagger(app)
     db.init_app(app)
     app.cli.add_command(create_db_command)
+    app.cli.add_command(migrate_db_command)
     app.register_blueprint(auth_bp)
     app.register_blueprint(item_bp)
     app.register_blueprint(static_bp)
@@ -4,3 +4,7 @@ class EmailAlreadyRegisteredError(RuntimeError):
 
 class UserNotFoundError(RuntimeError):
     pass
+
+
+class InvalidJWTError(ValueError):
+    pass
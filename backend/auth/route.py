@@ -1,14 +1,14 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
+import time
+from datetime import timedelta
 from http import HTTPStatus
-from typing import TYPE_CHECKING, Any, Iterable, Mapping, cast
+from typing import TYPE_CHECKING, Any, Final, Mapping, cast
 
 from flask import Blueprint, Response, current_app, make_response, request
 
-from auth.exception import EmailAlreadyRegisteredError
+from auth.exception import EmailAlreadyRegisteredError, InvalidJWTError
 from auth.util import (
-    BIRTHDAY_FORMAT,
     HS256JWTCodec,
     UserProfile,
     fetch_user_profile,
@@ -16,6 +16,7 @@ from auth.util import (
     is_registered,
     is_valid_birthday,
     is_valid_email,
+    parse_birthday,
     register,
 )
 from response_message import (
@@ -26,16 +27,31 @@ from response_message import (
     INVALID_DATA,
     WRONG_DATA_FORMAT,
 )
-from util import fetch_page, make_single_message_response, route_with_doc
+from util import (
+    make_cached_page_response,
+    make_single_message_response,
+    route_with_doc,
+)
 
 if TYPE_CHECKING:
     from flask.wrappers import Response
 
 auth_bp = Blueprint("auth", __name__)
 
+_REGISTER_REQUIRED_COLUMNS: Final[frozenset[str]] = frozenset(
+    {
+        "firstname",
+        "lastname",
+        "gender",
+        "birthday",
+        "e-mail",
+        "password",
+    }
+)
+
 
 @route_with_doc(auth_bp, "/login", methods=["GET", "POST"])
-def login_route() -> Response | str:
+def login_route() -> Response:
     if request.method == "POST":
         data = request.json
 
@@ -63,26 +79,18 @@ def login_route() -> Response | str:
 
             return response
 
-    return fetch_page("login")
+    return make_cached_page_response("login")
 
 
 @route_with_doc(auth_bp, "/register", methods=["GET", "POST"])
-def register_route() -> Response | str:
+def register_route() -> Response:
     if request.method == "POST":
         # 400 Bad Request error will automatically be raised
         # if the content-type is not "application/json", so
         # it's safe to cast it manually for type warning suppression.
         data = cast(dict, request.json)
 
-        required_columns: list[str] = [
-            "firstname",
-            "lastname",
-            "gender",
-            "birthday",
-            "e-mail",
-            "password",
-        ]
-        if not _has_required_columns(data, required_columns):
+        if not _has_required_columns(data, _REGISTER_REQUIRED_COLUMNS):
             return make_single_message_response(
                 HTTPStatus.BAD_REQUEST, message=WRONG_DATA_FORMAT
             )
@@ -95,9 +103,7 @@ def register_route() -> Response | str:
             firstname=data["firstname"],
             lastname=data["lastname"],
             gender=data["gender"],
-            birthday=int(
-                datetime.strptime(data["birthday"], BIRTHDAY_FORMAT).timestamp()
-            ),
+            birthday=parse_birthday(data["birthday"]),
         )
         try:
             register(data["e-mail"], data["password"], profile)
@@ -108,7 +114,7 @@ def register_route() -> Response | str:
         else:
             return make_single_message_response(HTTPStatus.OK)
 
-    return fetch_page("register")
+    return make_cached_page_response("register")
 
 
 @route_with_doc(auth_bp, "/verify_jwt", methods=["POST"])
@@ -117,14 +123,14 @@ def verify_jwt_route() -> Response:
         return make_single_message_response(HTTPStatus.UNAUTHORIZED, ABSENT_COOKIE)
 
     jwt_token: str = request.cookies["jwt"]
-    jwt_codec = HS256JWTCodec(current_app.config["jwt_key"])
+    jwt_codec: HS256JWTCodec = current_app.extensions["jwt_codec"]
 
-    if not jwt_codec.is_valid_jwt(jwt_token):
+    try:
+        jwt_payload: dict[str, Any] = jwt_codec.decode(jwt_token)
+    except InvalidJWTError:
         return make_single_message_response(
             HTTPStatus.UNPROCESSABLE_ENTITY, INVALID_COOKIE
         )
-
-    jwt_payload: dict[str, Any] = jwt_codec.decode(jwt_token)
     return make_response(jwt_payload)
 
 
@@ -139,8 +145,8 @@ def _is_correct_email_and_password(email: str, password: str) -> bool:
     return is_registered(email) and is_correct_password(email, password)
 
 
-def _has_required_columns(data: Mapping, required_columns: Iterable) -> bool:
-    return all([col in data for col in required_columns])
+def _has_required_columns(data: Mapping, required_columns: frozenset) -> bool:
+    return required_columns.issubset(data)
 
 
 def _has_valid_register_data_format(data: Mapping[str, Any]) -> bool:
@@ -152,10 +158,11 @@ def _set_jwt_cookie_to_response(
     response: Response,
     expiration_time_delta: timedelta = timedelta(days=1),
 ) -> None:
-    codec = HS256JWTCodec(current_app.config["jwt_key"])
+    codec: HS256JWTCodec = current_app.extensions["jwt_codec"]
     token: str = codec.encode(payload, expiration_time_delta)
     response.set_cookie(
         "jwt",
         value=token,
-        expires=datetime.now(tz=timezone.utc) + expiration_time_delta,
+        # a plain timestamp spares the datetime arithmetic
+        expires=int(time.time() + expiration_time_delta.total_seconds()),
     )
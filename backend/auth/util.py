@@ -1,45 +1,86 @@
+import calendar
 import hashlib
+import hmac
 import re
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from enum import IntEnum
+from enum import Enum, IntEnum
 from functools import wraps
 from http import HTTPStatus
-from typing import TYPE_CHECKING, Any, Final
+from typing import TYPE_CHECKING, Any, Final, Iterable
 
 import jwt
 from flask import current_app, make_response, request
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 
-from auth.exception import EmailAlreadyRegisteredError, UserNotFoundError
+from auth.exception import (
+    EmailAlreadyRegisteredError,
+    InvalidJWTError,
+    UserNotFoundError,
+)
 from database import db
 from models import User
 from util import SingleMessageStatus
 
 if TYPE_CHECKING:
+    from flask.wrappers import Response
     from sqlalchemy.engine.row import Row
     from sqlalchemy.sql.dml import Insert
     from sqlalchemy.sql.selectable import Select
 
 EMAIL_REGEX: Final[str] = r"^[A-Za-z0-9_]+([.-]?[A-Za-z0-9_]+)*@[A-Za-z0-9_]+([.-]?[A-Za-z0-9_]+)*(\.[A-Za-z0-9_]{2,3})+$"  # fmt: skip
-BIRTHDAY_FORMAT: Final[str] = "%Y-%m-%d"
 
-
-def is_full_matched_with_regex(string: str, regex: str) -> bool:
-    return bool(re.fullmatch(regex, string))
+_EMAIL_RE: Final[re.Pattern[str]] = re.compile(EMAIL_REGEX)
+# "header.payload.signature", each segment base64url-encoded
+_JWT_RE: Final[re.Pattern[str]] = re.compile(
+    r"^[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+$"
+)
+# YYYY-MM-DD, month and day optionally unpadded
+_BIRTHDAY_RE: Final[re.Pattern[str]] = re.compile(
+    r"^([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})$"
+)
+# indexed by month; February of a common year
+_DAYS_IN_MONTH: Final[tuple[int, ...]] = (
+    0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31
+)  # fmt: skip
 
 
 def is_valid_email(email: str) -> bool:
-    return is_full_matched_with_regex(email, EMAIL_REGEX)
+    return _EMAIL_RE.fullmatch(email) is not None
 
 
 def is_valid_birthday(birthday: str) -> bool:
     """Returns whether `birthday` is in format "%Y-%m-%d" and the day exists."""
-    try:
-        datetime.strptime(birthday, BIRTHDAY_FORMAT)
-    except ValueError:
+    match: re.Match[str] | None = _BIRTHDAY_RE.fullmatch(birthday)
+    if match is None:
         return False
-    return True
+    year, month, day = map(int, match.groups())
+    return _is_existing_date(year, month, day)
+
+
+def is_valid_birthday_batch(birthdays: Iterable[str]) -> list[bool]:
+    """Returns whether each of `birthdays` is valid, in order. For bulk registration."""
+    return [is_valid_birthday(birthday) for birthday in birthdays]
+
+
+def _is_existing_date(year: int, month: int, day: int) -> bool:
+    """Checks the date with integer arithmetic only, instead of constructing a `datetime`."""
+    if year < 1 or not 1 <= month <= 12:
+        return False
+    days_in_month: int = _DAYS_IN_MONTH[month]
+    if month == 2 and calendar.isleap(year):
+        days_in_month += 1
+    return 1 <= day <= days_in_month
+
+
+def parse_birthday(birthday: str) -> int:
+    """Returns the UTC timestamp of `birthday`, which should already be valid.
+
+    Much cheaper than `datetime.strptime`, which goes through the locale-aware parser.
+    """
+    year, month, day = map(int, birthday.split("-"))
+    return calendar.timegm((year, month, day, 0, 0, 0))
 
 
 @dataclass
@@ -48,6 +89,15 @@ class Gender(IntEnum):
     FEMALE = 1
 
 
+class PasswordScheme(str, Enum):
+    SHA512 = "sha512"  # legacy, single round
+    SCRYPT = "scrypt"
+
+
+# Yields 64 bytes, which is 128 hex characters, the same width as SHA-512.
+SCRYPT_PARAMS: Final[dict[str, int]] = {"n": 2**14, "r": 8, "p": 1, "dklen": 64}
+
+
 @dataclass
 class UserProfile:
     firstname: str
@@ -86,18 +136,21 @@ class HS256JWTCodec:
         return token
 
     def decode(self, token: str) -> dict[str, Any]:
-        data: dict[str, Any] = jwt.decode(
-            token, key=self._key, algorithms=[self._algorithm]
-        )
-        return data
-
-    def is_valid_jwt(self, token: str) -> bool:
-        """Returns False if the expiration time (exp) is in the past or it failed validation."""
+        """
+        Raises:
+            InvalidJWTError: `token` is malformed, failed validation or
+                its expiration time (exp) is in the past.
+        """
+        # cheap structural check before paying for the HMAC
+        if _JWT_RE.fullmatch(token) is None:
+            raise InvalidJWTError(token)
         try:
-            self.decode(token)
-        except (jwt.exceptions.DecodeError, jwt.exceptions.ExpiredSignatureError):
-            return False
-        return True
+            data: dict[str, Any] = jwt.decode(
+                token, key=self._key, algorithms=[self._algorithm]
+            )
+        except jwt.exceptions.InvalidTokenError as e:
+            raise InvalidJWTError(token) from e
+        return data
 
 
 def register(email: str, password: str, profile: UserProfile) -> None:
@@ -105,42 +158,81 @@ def register(email: str, password: str, profile: UserProfile) -> None:
     Raises:
         EmailAlreadyRegisteredError: `email` should not be already registered.
     """
-
-    if is_registered(email):
-        raise EmailAlreadyRegisteredError(email)
-
     insert_new_user_stmt: Insert = db.insert(User).values(
         email=email,
-        password=hash_with_sha512(password),
+        password=hash_with_scrypt(password, email),
+        password_scheme=PasswordScheme.SCRYPT.value,
         firstname=profile.firstname,
         lastname=profile.lastname,
         gender=profile.gender,
         birthday=profile.birthday,
     )
-    db.session.execute(insert_new_user_stmt)
-    db.session.commit()
+    # Relies on the UNIQUE constraint of email instead of probing for it beforehand.
+    try:
+        db.session.execute(insert_new_user_stmt)
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        if is_registered(email):
+            raise EmailAlreadyRegisteredError(email)
+        raise
 
 
 def is_correct_password(registered_email: str, password_to_check: str) -> bool:
-    """The `registered_email` should be already registered, otherwise Exception raised by the database."""
-    select_password_with_email_stmt: Select = db.select(User.password).where(
-        User.email == registered_email
-    )
-    password: str = db.session.execute(select_password_with_email_stmt).scalar_one()
+    """The `registered_email` should be already registered, otherwise Exception raised by the database.
 
-    return hash_with_sha512(password_to_check) == password
+    A correct password stored with the legacy scheme is rehashed with scrypt.
+    """
+    select_password_with_email_stmt: Select = db.select(
+        User.password, User.password_scheme
+    ).where(User.email == registered_email)
+    password, scheme = db.session.execute(select_password_with_email_stmt).one()
+
+    if scheme == PasswordScheme.SCRYPT:
+        return hmac.compare_digest(
+            hash_with_scrypt(password_to_check, registered_email), password
+        )
+
+    if not hmac.compare_digest(hash_with_sha512(password_to_check), password):
+        return False
+    db.session.execute(
+        db.update(User)
+        .where(User.email == registered_email)
+        .values(
+            password=hash_with_scrypt(password_to_check, registered_email),
+            password_scheme=PasswordScheme.SCRYPT.value,
+        )
+    )
+    db.session.commit()
+    return True
 
 
 def is_registered(email: str) -> bool:
     """Returns whether the email is already used."""
-    select_user_with_email_stmt: Select = db.select(User).where(User.email == email)
+    select_user_with_email_stmt: Select = (
+        db.select(User.uid).where(User.email == email).limit(1)
+    )
+    return db.session.execute(select_user_with_email_stmt).first() is not None
 
-    user_count: int = len(db.session.execute(select_user_with_email_stmt).all())
-    return user_count != 0
+
+def hash_with_scrypt(password: str, email: str) -> str:
+    """Returns the hex digest of `password` key-stretched with scrypt, salted by `email`.
+
+    All the rounds run inside a single call into OpenSSL.
+    """
+    return hashlib.scrypt(
+        password.encode("utf-8"), salt=email.encode("utf-8"), **SCRYPT_PARAMS
+    ).hex()
 
 
 def hash_with_sha512(string: str) -> str:
-    return hashlib.sha512(string.encode("utf-8")).hexdigest()
+    return hash_passwords_batch([string.encode("utf-8")])[0]
+
+
+def hash_passwords_batch(passwords: Iterable[bytes]) -> list[str]:
+    """Returns the hex digests of `passwords` hashed with SHA-512, in order."""
+    sha512 = hashlib.sha512
+    return [sha512(password).hexdigest() for password in passwords]
 
 
 def fetch_user_profile(email: str) -> dict[str, Any]:
@@ -148,28 +240,35 @@ def fetch_user_profile(email: str) -> dict[str, Any]:
     Raises:
         UserNotFoundError: No registered user with email `email`.
     """
-    if not is_registered(email):
-        raise UserNotFoundError
-
     select_user_profile_with_email_stmt: Select = select(
         User.firstname, User.lastname, User.gender, User.birthday
     ).where(User.email == email)
-    user_profile: Row = db.session.execute(
+    user_profile: Row | None = db.session.execute(
         select_user_profile_with_email_stmt
     ).fetchone()
+    if user_profile is None:
+        raise UserNotFoundError
     return dict(user_profile)
 
 
 def verify_login_or_return_401(func):
     @wraps(func)
     def wrapper(*args, **kwargs):
-        codec = HS256JWTCodec(current_app.config["jwt_key"])
+        codec: HS256JWTCodec = current_app.extensions["jwt_codec"]
         cookie: str | None = request.cookies.get("jwt")
 
-        if cookie is None or not codec.is_valid_jwt(cookie):
-            status = SingleMessageStatus(HTTPStatus.UNAUTHORIZED, "Unauthorized.")
-            return make_response(status.message, status.code)
+        if cookie is None:
+            return _make_unauthorized_response()
+        try:
+            codec.decode(cookie)
+        except InvalidJWTError:
+            return _make_unauthorized_response()
 
         return func(*args, **kwargs)
 
     return wrapper
+
+
+def _make_unauthorized_response() -> "Response":
+    status = SingleMessageStatus(HTTPStatus.UNAUTHORIZED, "Unauthorized.")
+    return make_response(status.message, status.code)
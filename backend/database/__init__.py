@@ -6,7 +6,7 @@ from typing import Final
 import click
 from flask import current_app
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import event
+from sqlalchemy import event, inspect
 from sqlalchemy.engine import Engine
 
 db: Final[SQLAlchemy] = SQLAlchemy()
@@ -36,3 +36,36 @@ def create_db_command() -> None:
 def create_db() -> None:
     with current_app.app_context():
         db.create_all()
+
+
+@click.command("migrate-db")
+def migrate_db_command() -> None:
+    migrate_db()
+    click.echo("Migrated the database.")
+
+
+def migrate_db() -> None:
+    """Brings tables created by an older version up to date. Safe to run repeatedly.
+
+    `create_db` only creates missing tables and never alters existing ones.
+    """
+    with current_app.app_context():
+        _add_password_scheme_column_to_user()
+
+
+def _add_password_scheme_column_to_user() -> None:
+    """Rows existing before the column was added were hashed with plain SHA-512."""
+    table_name: str = User.__tablename__
+    columns: set[str] = {
+        column["name"] for column in inspect(db.engine).get_columns(table_name)
+    }
+    if "password_scheme" in columns:
+        return
+    quoted_table_name: str = db.engine.dialect.identifier_preparer.quote(table_name)
+    db.session.execute(
+        db.text(
+            f"ALTER TABLE {quoted_table_name} ADD COLUMN password_scheme"
+            " VARCHAR(16) NOT NULL DEFAULT 'sha512'"
+        )
+    )
+    db.session.commit()
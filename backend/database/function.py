@@ -0,0 +1,47 @@
+"""SQL functions to build JSON inside the database, compiled to the spelling of each dialect.
+
+Both are typed as JSON, so the results come back already deserialized.
+"""
+
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import GenericFunction
+from sqlalchemy.types import JSON
+
+
+class json_object(GenericFunction):
+    """Builds a JSON object from alternating keys and values."""
+
+    type = JSON()
+    inherit_cache = True
+
+
+class json_array_agg(GenericFunction):
+    """Aggregates the values of a group into a JSON array."""
+
+    type = JSON()
+    inherit_cache = True
+
+
+@compiles(json_object)  # SQLite and MySQL/MariaDB
+def _compile_json_object(element, compiler, **kw) -> str:
+    return f"json_object({compiler.process(element.clauses, **kw)})"
+
+
+@compiles(json_object, "postgresql")
+def _compile_json_object_postgresql(element, compiler, **kw) -> str:
+    return f"json_build_object({compiler.process(element.clauses, **kw)})"
+
+
+@compiles(json_array_agg)  # MySQL/MariaDB
+def _compile_json_array_agg(element, compiler, **kw) -> str:
+    return f"JSON_ARRAYAGG({compiler.process(element.clauses, **kw)})"
+
+
+@compiles(json_array_agg, "sqlite")
+def _compile_json_array_agg_sqlite(element, compiler, **kw) -> str:
+    return f"json_group_array({compiler.process(element.clauses, **kw)})"
+
+
+@compiles(json_array_agg, "postgresql")
+def _compile_json_array_agg_postgresql(element, compiler, **kw) -> str:
+    return f"json_agg({compiler.process(element.clauses, **kw)})"
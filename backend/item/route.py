@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from http import HTTPStatus
-from typing import Any
+from typing import Any, Final
 
 from flask import Blueprint, make_response, request
 from pydantic import ValidationError
@@ -10,50 +10,62 @@ from sqlalchemy.sql.expression import Delete, Select
 
 from auth.util import verify_login_or_return_401
 from database import db
-from item.util import PayloadTypeChecker, flatten_item_payload
+from database.function import json_array_agg, json_object
+from item.util import PayloadTypeChecker, check_payload_type, flatten_item_payload
 from models import Item, Tag, TagOfItem
 from util import fetch_page, make_single_message_response, route_with_doc
 
 item_bp = Blueprint("item", __name__)
 
+# The keys a PUT payload may carry once its price is flattened; id is immutable.
+_UPDATABLE_ITEM_KEYS: Final[frozenset[str]] = (
+    frozenset(Item.__table__.columns.keys()) - {"id"}
+) | {"tags"}
+
 
 @route_with_doc(item_bp, "/items", methods=["GET"])
 def fetch_all_items():
-    items: list[Item] = db.session.execute(db.select(Item)).scalars().all()
-    tag_of_items: list[Row] = db.session.execute(
-        db.select(TagOfItem.item_id, TagOfItem.tag_id, Tag.name)
+    # Plain rows instead of ORM instances; this endpoint only reads.
+    items: list[Row] = db.session.execute(
+        db.select(
+            Item.id,
+            Item.name,
+            Item.count,
+            Item.description,
+            Item.original,
+            Item.discount,
+            Item.avatar,
+        )
+    ).all()
+    # The tags are grouped into a JSON array per item by the database.
+    tags_of_items: list[Row] = db.session.execute(
+        db.select(
+            TagOfItem.item_id,
+            json_array_agg(json_object("id", TagOfItem.tag_id, "name", Tag.name)),
+        )
         .select_from(TagOfItem)
         .join(Tag)
+        .group_by(TagOfItem.item_id)
     ).all()
+    tags_list_dict_by_item_id: dict[int, list[dict[str, Any]]] = {
+        item_id: tags for item_id, tags in tags_of_items
+    }
 
-    tags_list_dict_by_item_id: dict[int, list[dict[str, Any]]] = {}
-
-    for tag_of_item in tag_of_items:
-        item_id = tag_of_item.item_id
-        tag_id = tag_of_item.tag_id
-        tag_name = tag_of_item.name
-
-        if item_id not in tags_list_dict_by_item_id:
-            tags_list_dict_by_item_id[item_id] = []
-        tags_list_dict_by_item_id[item_id].append({"id": tag_id, "name": tag_name})
-
-    item_represent_list: list[dict[str, Any]] = []
-
-    for item in items:
-        item_represent_list.append(
-            {
-                "avatar": item.avatar,
-                "count": item.count,
-                "description": item.description,
-                "id": item.id,
-                "name": item.name,
-                "price": {
-                    "discount": item.discount,
-                    "original": item.original,
-                },
-                "tags": tags_list_dict_by_item_id.get(item.id, []),
-            }
-        )
+    item_represent_list: list[dict[str, Any]] = [
+        {
+            "avatar": item.avatar,
+            "count": item.count,
+            "description": item.description,
+            "id": item.id,
+            "name": item.name,
+            "price": {
+                "discount": item.discount,
+                "original": item.original,
+            },
+            "tags": tags_list_dict_by_item_id.get(item.id, []),
+        }
+        for item in items
+    ]
 
     return make_response(item_represent_list)
 
@@ -78,9 +90,8 @@ def add_item():
             "The data has the wrong format and the server can't understand it.",
         )
     try:
-        PayloadTypeChecker.Item(**flat_payload)
-        for tag_id in tag_ids:
-            PayloadTypeChecker.Tag(id=tag_id)
+        check_payload_type(PayloadTypeChecker.Item, flat_payload)
+        check_payload_type(PayloadTypeChecker.TagIds, {"ids": tag_ids})
     except ValidationError:
         return make_single_message_response(
             HTTPStatus.UNPROCESSABLE_ENTITY,
@@ -92,8 +103,7 @@ def add_item():
     db.session.flush()
 
     item_id = item.id
-    for tag_id in tag_ids:
-        db.session.add(TagOfItem(item_id=item_id, tag_id=tag_id))
+    _insert_tags_of_item(item_id, tag_ids)
 
     db.session.commit()
     return make_response({"id": item_id})
@@ -154,30 +164,25 @@ def update_specific_item(id):
         del payload["price"]
 
     # validate payload data field
-    item_attributes: list = list(item.__dict__.keys())
-    if (
-        not _validate_keys(payload.keys(), item_attributes, ["tags"])
-        or "id" in payload.keys()
-    ):
+    if not payload.keys() <= _UPDATABLE_ITEM_KEYS:
         return make_single_message_response(
             HTTPStatus.BAD_REQUEST,
             "The data has the wrong format and the server can't understand it.",
         )
 
-    # validate tags exist
-    if "tags" in payload and not _is_tags_exist(payload["tags"]):
+    # validate payload data type, before the tags are used in a query
+    try:
+        check_payload_type(PayloadTypeChecker.Item, payload)
+        if "tags" in payload:
+            check_payload_type(PayloadTypeChecker.TagIds, {"ids": payload["tags"]})
+    except ValidationError:
         return make_single_message_response(
             HTTPStatus.UNPROCESSABLE_ENTITY,
             "The posted data has the correct format, but the data is invalid.",
         )
 
-    # validate payload data type
-    try:
-        PayloadTypeChecker.Item(**payload)
-        if "tags" in payload:
-            for tag_id in payload["tags"]:
-                PayloadTypeChecker.Tag(id=tag_id)
-    except ValidationError:
+    # validate tags exist
+    if "tags" in payload and not _is_tags_exist(payload["tags"]):
         return make_single_message_response(
             HTTPStatus.UNPROCESSABLE_ENTITY,
             "The posted data has the correct format, but the data is invalid.",
@@ -243,32 +248,33 @@ def _fetch_item_tags_list_from_item_id(id: int) -> list[dict[str, Any]]:
     )
     tags_query_result: list[Row] = db.session.execute(tags_join_stmts).all()
 
-    tags_dict_list: list[dict[str, Any]] = []
-    for tags_query in tags_query_result:
-        tags_dict_list.append({"id": tags_query.tag_id, "name": tags_query.name})
-
-    return tags_dict_list
+    return [
+        {"id": tags_query.tag_id, "name": tags_query.name}
+        for tags_query in tags_query_result
+    ]
 
 
 def _setup_tags_relationship_of_item(item_id: int, tags_id_list: list[int]):
+    """Replaces the tags of the item. Not committed; the caller commits the delete
+    and the insert as a single transaction.
+    """
     # Step 1. Drop all tags of item if exists.
     delete_tags_stmts: Delete = db.delete(TagOfItem).where(TagOfItem.item_id == item_id)
     db.session.execute(delete_tags_stmts)
-    db.session.commit()
 
     # Step 2. Insert all tags relationship
-    for tag_id in tags_id_list:
-        db.session.add(TagOfItem(item_id=item_id, tag_id=tag_id))
-    db.session.commit()
+    _insert_tags_of_item(item_id, tags_id_list)
 
 
-def _validate_keys(target_keys: list, known_keys: list, skip_keys: list) -> bool:
-    for key in target_keys:
-        if key in skip_keys:
-            continue
-        if key not in known_keys:
-            return False
-    return True
+def _insert_tags_of_item(item_id: int, tags_id_list: list[int]) -> None:
+    """Inserts the relationships with a single executemany INSERT instead of adding
+    a `TagOfItem` to the session per tag. Not committed.
+    """
+    if tags_id_list:
+        db.session.execute(
+            db.insert(TagOfItem),
+            [{"item_id": item_id, "tag_id": tag_id} for tag_id in tags_id_list],
+        )
 
 
 def _is_tags_exist(tags: list[int]) -> bool:
@@ -1,6 +1,6 @@
 from typing import Any
 
-from pydantic import StrictInt, StrictStr, Field
+from pydantic import Field, StrictInt, StrictStr, validate_model
 from pydantic.dataclasses import dataclass
 
 
@@ -20,6 +20,25 @@ class PayloadTypeChecker:
         id: StrictInt = Field(default=0)
         name: StrictStr = Field(default="")
 
+    @dataclass
+    class TagIds:
+        """Validates all the tag ids of an item at once."""
+
+        ids: list[StrictInt] = Field(default_factory=list)
+
+
+def check_payload_type(checker: type, payload: dict[str, Any]) -> None:
+    """Validates `payload` against the model of `checker`, one of the dataclasses in
+    `PayloadTypeChecker`, without instantiating the dataclass.
+
+    Raises:
+        ValidationError: Some values of `payload` are in the wrong type.
+    """
+    model = checker.__pydantic_model__  # type: ignore[attr-defined]
+    _, _, error = validate_model(model, payload)
+    if error is not None:
+        raise error
+
 
 def flatten_item_payload(payload: dict[str, Any]) -> dict[str, Any]:
     flat_payload: dict[str, Any] = {
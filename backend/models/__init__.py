@@ -5,6 +5,8 @@ class User(db.Model):  # type: ignore[name-defined]
     uid = db.Column(db.Integer, primary_key=True, autoincrement=True)
     email = db.Column(db.String(100), unique=True)
     password = db.Column(db.String(1000), nullable=False)
+    # Rows created before scrypt was adopted are hashed with plain SHA-512.
+    password_scheme = db.Column(db.String(16), nullable=False, server_default="sha512")
     firstname = db.Column(db.String(100), nullable=False)
     lastname = db.Column(db.String(100), nullable=False)
     gender = db.Column(db.Integer, nullable=False)
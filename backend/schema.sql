@@ -2,8 +2,9 @@
 
 CREATE TABLE IF NOT EXISTS `user` (
   `uid` INTEGER PRIMARY KEY AUTO_INCREMENT,
-  `email` TEXT NOT NULL,
+  `email` VARCHAR(100) NOT NULL UNIQUE,
   `password` TEXT NOT NULL,
+  `password_scheme` VARCHAR(16) NOT NULL DEFAULT 'sha512',
   `firstname` TEXT NOT NULL,
   `lastname` TEXT NOT NULL,
   `gender` INT NOT NULL,
@@ -1,2 +1,6 @@
 class ImageNotExistError(FileNotFoundError):
     pass
+
+
+class InvalidImageContentError(ValueError):
+    pass
@@ -4,7 +4,7 @@ from http import HTTPStatus
 from typing import TYPE_CHECKING
 from uuid import uuid4
 
-from flask import Blueprint, make_response, request, send_file
+from flask import Blueprint, make_response, request, send_from_directory
 
 from auth.util import verify_login_or_return_401
 from response_message import (
@@ -12,6 +12,7 @@ from response_message import (
     INVALID_UUID,
     WRONG_DATA_FORMAT,
 )
+from static.exception import InvalidImageContentError
 from static.util import (
     delete_image,
     get_file_path_by_image_uuid,
@@ -24,6 +25,8 @@ from static.util import (
 from util import make_single_message_response, route_with_doc
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from flask.wrappers import Response
 
 static_bp = Blueprint("static", __name__)
@@ -39,7 +42,9 @@ def fetch_image_with_specific_id(uuid: str) -> Response:
             HTTPStatus.NOT_FOUND, ABSENT_IMAGE_WITH_SPECIFIC_UUID
         )
 
-    return send_file(get_file_path_by_image_uuid(uuid), mimetype="image/png")
+    # safe-joins the file name under the image directory before sending it
+    image_path: Path = get_file_path_by_image_uuid(uuid)
+    return send_from_directory(image_path.parent, image_path.name, mimetype="image/png")
 
 
 @route_with_doc(static_bp, "/static/images", methods=["POST"])
@@ -50,9 +55,12 @@ def upload_image() -> Response:
     if not verify_image_base64_content(image_base64_content):
         return make_single_message_response(HTTPStatus.BAD_REQUEST, WRONG_DATA_FORMAT)
 
-    image_byte_data: bytes = get_image_byte_data_from_base64_content(
-        image_base64_content
-    )
+    try:
+        image_byte_data: bytes = get_image_byte_data_from_base64_content(
+            image_base64_content
+        )
+    except InvalidImageContentError:
+        return make_single_message_response(HTTPStatus.BAD_REQUEST, WRONG_DATA_FORMAT)
     image_uuid = str(uuid4())
     write_image_with_byte_data(image_byte_data, image_uuid)
 
@@ -76,9 +84,12 @@ def modify_image_with_specific_id(uuid: str) -> Response:
     if not verify_image_base64_content(image_base64_content):
         return make_single_message_response(HTTPStatus.BAD_REQUEST, WRONG_DATA_FORMAT)
 
-    image_byte_data: bytes = get_image_byte_data_from_base64_content(
-        image_base64_content
-    )
+    try:
+        image_byte_data: bytes = get_image_byte_data_from_base64_content(
+            image_base64_content
+        )
+    except InvalidImageContentError:
+        return make_single_message_response(HTTPStatus.BAD_REQUEST, WRONG_DATA_FORMAT)
     write_image_with_byte_data(image_byte_data, uuid)
 
     return make_single_message_response(HTTPStatus.OK)
@@ -1,10 +1,22 @@
+import os
 import re
-from base64 import b64decode
 from pathlib import Path
+from typing import Final
 
 from flask import current_app
 
-from static.exception import ImageNotExistError
+try:
+    # SIMD-accelerated, a drop-in replacement of the standard one
+    from pybase64 import b64decode
+except ImportError:  # pragma: no cover
+    from base64 import b64decode  # type: ignore[assignment]
+
+from static.exception import ImageNotExistError, InvalidImageContentError
+
+_IMAGE_BASE64_CONTENT_HEADER: Final[str] = "data:image/png;base64,"
+_UUID_RE: Final[re.Pattern[str]] = re.compile(
+    r"^[A-Za-z0-9]{8}-[A-Za-z0-9]{4}-[A-Za-z0-9]{4}-[A-Za-z0-9]{4}-[A-Za-z0-9]{12}$"
+)
 
 
 def has_image_with_specific_uuid(image_uuid: str) -> bool:
@@ -29,7 +41,7 @@ def delete_image(image_uuid: str) -> None:
 def write_image_with_byte_data(byte_data: bytes, image_uuid: str) -> None:
     """Writes the byte data to the image file with specific `image_uuid`."""
     image_path: Path = get_file_path_by_image_uuid(image_uuid)
-    image_path.write_bytes(byte_data)
+    _write_bytes_unbuffered(image_path, byte_data)
 
 
 def get_image_byte(image_uuid: str) -> bytes:
@@ -45,6 +57,21 @@ def get_image_byte(image_uuid: str) -> bytes:
         raise ImageNotExistError(image_path)
 
 
+def _write_bytes_unbuffered(path: Path, byte_data: bytes) -> None:
+    """Writes `byte_data` to `path` with `os.write` on a raw file descriptor,
+    looping over a memoryview of the data until all of it is written.
+    """
+    # 0o666 masked by the umask, the same permissions as `Path.write_bytes` gives
+    fd: int = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(byte_data)
+        while view:
+            written: int = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
 def get_file_path_by_image_uuid(uuid: str) -> Path:
     """
     Image with `uuid` has path `STATIC_RESOURCE_PATH`/`image_id`.png,
@@ -61,26 +88,38 @@ def get_file_path_by_image_uuid(uuid: str) -> Path:
 def get_image_byte_data_from_base64_content(base64_content: str) -> bytes:
     """Returns the byte data of image from base64 content.
 
+    The base64 data is validated while being decoded, so it's scanned only once.
+
     Args:
         base64_content (str): The content in the form `data:image/png;base64,<some base64 data>`.
+
+    Raises:
+        InvalidImageContentError: The base64 data is empty or malformed.
     """
-    header, base64_data = base64_content.split(",")
-    return b64decode(base64_data)
+    # slices past the header instead of splitting, so the header is never copied
+    base64_data: str = base64_content[base64_content.find(",") + 1 :]
+    if not base64_data:
+        raise InvalidImageContentError("empty base64 data")
+    try:
+        return b64decode(base64_data, validate=True)
+    # binascii.Error is a ValueError; the stdlib decoder raises a bare ValueError
+    # on non-ASCII data
+    except ValueError as e:
+        raise InvalidImageContentError(str(e)) from e
 
 
 def verify_image_base64_content(content: str) -> bool:
-    """Verifies the data of the image using Regex.
+    """Verifies the header of the image content.
+
+    The base64 data itself is validated by `get_image_byte_data_from_base64_content`.
 
     Args:
         content (str): The content in the form `data:image/png;base64,<some base64 data>`.
 
     Returns:
-        bool: The content is valid or not.
+        bool: The content has the PNG base64 header or not.
     """
-    return (
-        re.fullmatch(r"^data:image/png;base64,[A-Za-z0-9+/]+={0,2}$", content)
-        is not None
-    )
+    return content.startswith(_IMAGE_BASE64_CONTENT_HEADER)
 
 
 def verify_uuid(uuid: str) -> bool:
@@ -89,10 +128,4 @@ def verify_uuid(uuid: str) -> bool:
     Returns:
         bool: The UUID is valid or not.
     """
-    return (
-        re.fullmatch(
-            r"^[A-Za-z0-9]{8}-[A-Za-z0-9]{4}-[A-Za-z0-9]{4}-[A-Za-z0-9]{4}-[A-Za-z0-9]{12}$",
-            uuid,
-        )
-        is not None
-    )
+    return _UUID_RE.fullmatch(uuid) is not None
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import time
+from datetime import timedelta
 from http import HTTPStatus
 from http.cookiejar import Cookie, CookieJar
 from typing import TYPE_CHECKING, Any
@@ -231,6 +233,26 @@ class TestLoginRoute:
         with assert_not_raise(ValueError):
             (jwt_cookie,) = tuple(filter(lambda x: x.name == "jwt", cookies))
 
+    def test_post_with_correct_data_should_have_jwt_cookie_expire_in_one_day(
+        self,
+        client: FlaskClient,
+        new_data: dict[str, Any],
+    ) -> None:
+        one_day_in_seconds = int(timedelta(days=1).total_seconds())
+        time_before_login = int(time.time())
+
+        client.post("/login", json=new_data)
+
+        time_after_login = int(time.time())
+        cookies: tuple[Cookie, ...] = _get_cookies(client.cookie_jar)
+        (jwt_cookie,) = tuple(filter(lambda x: x.name == "jwt", cookies))
+        assert jwt_cookie.expires is not None
+        assert (
+            time_before_login + one_day_in_seconds
+            <= jwt_cookie.expires
+            <= time_after_login + one_day_in_seconds
+        )
+
     def test_post_with_correct_data_should_have_correct_jwt_token_attribute(
         self,
         app: Flask,
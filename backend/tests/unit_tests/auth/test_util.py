@@ -4,21 +4,29 @@ from datetime import timedelta
 from typing import TYPE_CHECKING, Any, ClassVar
 
 import freezegun
-import jwt
 import pytest
 from flask import Response
 from werkzeug.datastructures import MultiDict
 
-from auth.exception import EmailAlreadyRegisteredError, UserNotFoundError
+from auth.exception import (
+    EmailAlreadyRegisteredError,
+    InvalidJWTError,
+    UserNotFoundError,
+)
 from auth.util import (
     Gender,
     HS256JWTCodec,
+    PasswordScheme,
     UserProfile,
     fetch_user_profile,
+    hash_passwords_batch,
+    hash_with_scrypt,
     is_correct_password,
     is_registered,
     is_valid_birthday,
+    is_valid_birthday_batch,
     is_valid_email,
+    parse_birthday,
     register,
     verify_login_or_return_401,
 )
@@ -99,6 +107,49 @@ class TestIsValidBirthday:
     ) -> None:
         assert not is_valid_birthday(bad_birthday)
 
+    @pytest.mark.parametrize(
+        argnames=("birthday", "is_valid"),
+        argvalues=(
+            ("2000-02-29", True),  # divisible by 400
+            ("1900-02-29", False),  # divisible by 100
+            ("2004-02-29", True),
+            ("2003-02-29", False),
+            ("2000-04-31", False),
+            ("2000-00-01", False),
+            ("0000-01-01", False),
+        ),
+    )
+    def test_on_edge_date_should_return_whether_the_day_exists(
+        self, birthday: str, is_valid: bool
+    ) -> None:
+        assert is_valid_birthday(birthday) == is_valid
+
+
+def test_is_valid_birthday_batch_should_return_validity_in_order() -> None:
+    birthdays: list[str] = ["2000-01-01", "2000/01/01", "2000-02-30", "2002-6-25"]
+
+    assert is_valid_birthday_batch(birthdays) == [True, False, False, True]
+
+
+class TestParseBirthday:
+    @pytest.mark.parametrize(
+        argnames=("birthday", "timestamp"),
+        argvalues=(
+            ("1970-01-01", 0),
+            ("2000-02-29", 951782400),
+            ("2002-06-25", 1024963200),
+        ),
+    )
+    def test_on_valid_birthday_should_return_utc_timestamp(
+        self, birthday: str, timestamp: int
+    ) -> None:
+        assert parse_birthday(birthday) == timestamp
+
+    def test_on_unpadded_birthday_should_return_same_timestamp_as_padded(
+        self,
+    ) -> None:
+        assert parse_birthday("2000-1-1") == parse_birthday("2000-01-01")
+
 
 class TestIsCorrectPassword:
     def test_on_correct_password_should_be_true(self, app: Flask) -> None:
@@ -123,6 +174,34 @@ class TestIsCorrectPassword:
             with pytest.raises(Exception):
                 is_correct_password(email, password)
 
+    def test_on_correct_legacy_password_should_rehash_with_scrypt(
+        self, app: Flask
+    ) -> None:
+        email: str = "test@email.com"
+        password: str = "test"
+        with app.app_context():
+
+            is_correct_password(email, password)
+
+            user: User = db.session.execute(
+                db.select(User).where(User.email == email)
+            ).scalar_one()
+            assert user.password_scheme == PasswordScheme.SCRYPT
+            assert user.password == hash_with_scrypt(password, email)
+            assert is_correct_password(email, password)
+
+    def test_on_incorrect_legacy_password_should_not_rehash(self, app: Flask) -> None:
+        email: str = "test@email.com"
+        password: str = "should_be_test"
+        with app.app_context():
+
+            is_correct_password(email, password)
+
+            user: User = db.session.execute(
+                db.select(User).where(User.email == email)
+            ).scalar_one()
+            assert user.password_scheme == PasswordScheme.SHA512
+
 
 class TestIsRegistered:
     def test_on_registered_email_should_be_true(self, app: Flask) -> None:
@@ -168,6 +247,25 @@ class TestRegister:
             assert user.firstname == some_user_profile.firstname
             assert user.lastname == some_user_profile.lastname
             assert user.gender == some_user_profile.gender
+            assert user.password_scheme == PasswordScheme.SCRYPT
+            assert user.password == hash_with_scrypt(password, email)
+
+
+class TestHashPasswordsBatch:
+    def test_on_empty_batch_should_return_empty_list(self) -> None:
+        assert hash_passwords_batch([]) == []
+
+    def test_on_multiple_passwords_should_return_digests_in_order(self) -> None:
+        passwords: list[str] = ["test", "other"]
+
+        digests: list[str] = hash_passwords_batch(
+            [password.encode("utf-8") for password in passwords]
+        )
+
+        assert digests == [
+            "ee26b0dd4af7e749aa1a8ee3c10ae9923f618980772e473f8819a5d4940e0db27ac185f8a0e1d5f84f88bc887fd67b143732c304cc5fa9ad8e6f57f50028a8ff",
+            "e25ac3845f8cbe12801a2dfa5a89d4c55dc47900f3b6edc9a9ee590f3c2b9312f665d0039c93828b7b58f33950bc817a0955a9c5000a8d3e280569f08745ca68",
+        ]
 
 
 class TestFetchUserProfile:
@@ -201,38 +299,41 @@ class TestHS256JWTCodec:
         expected: dict[str, str] = {"some": "payload"}
         assert data == expected
 
-    class TestIsValidJWT:
-        def test_on_token_with_not_enough_segment_should_return_false(
+    class TestDecodeWithInvalidToken:
+        def test_on_token_with_not_enough_segment_should_raise_exception(
             self,
             codec: HS256JWTCodec,
         ) -> None:
             token: str = "should_have_three_dot_separated_segments"
 
-            assert not codec.is_valid_jwt(token)
+            with pytest.raises(InvalidJWTError):
+                codec.decode(token)
 
-        def test_on_invalid_token_should_return_false(
+        def test_on_invalid_token_should_raise_exception(
             self, codec: HS256JWTCodec
         ) -> None:
             token: str = "this.failed.validation"
 
-            assert not codec.is_valid_jwt(token)
+            with pytest.raises(InvalidJWTError):
+                codec.decode(token)
 
-        def test_on_expired_token_should_return_false(
+        def test_on_expired_token_should_raise_exception(
             self, codec: HS256JWTCodec
         ) -> None:
             time_to_the_past = timedelta(days=-87)
 
             token: str = codec.encode({"some": "payload"}, time_to_the_past)
 
-            assert not codec.is_valid_jwt(token)
+            with pytest.raises(InvalidJWTError):
+                codec.decode(token)
 
-        def test_on_valid_token_should_return_true(self, codec: HS256JWTCodec) -> None:
-            payload: dict[str, str] = {"some": "payload"}
-            token: str = jwt.encode(payload, key=codec.key, algorithm=codec.algorithm)
-
-            is_valid_jwt: bool = codec.is_valid_jwt(token)
+        def test_on_token_signed_with_other_key_should_raise_exception(
+            self, codec: HS256JWTCodec
+        ) -> None:
+            token: str = HS256JWTCodec("other secret").encode({"some": "payload"})
 
-            assert is_valid_jwt
+            with pytest.raises(InvalidJWTError):
+                codec.decode(token)
 
 
 class TestVerifyLoginDecoratorWithMockRequest:
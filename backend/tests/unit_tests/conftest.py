@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import os
 import shutil
+import sqlite3
 import tempfile
+from contextlib import closing
 from pathlib import Path
-from typing import TYPE_CHECKING, Generator
+from typing import TYPE_CHECKING, Final, Generator
 
 import pytest
 
@@ -16,26 +17,54 @@ if TYPE_CHECKING:
     from flask import Flask
     from flask.testing import FlaskClient
 
+# Flask-SQLAlchemy serves an in-memory SQLite database through a single shared
+# connection, so each app gets its own database which lives as long as its engine.
+IN_MEMORY_DATABASE_URI: Final[str] = "sqlite:///:memory:"
+
+
+@pytest.fixture(scope="session")
+def template_db() -> Generator[sqlite3.Connection, None, None]:
+    """A database with the schema and test data, built only once per test session.
+
+    Each test gets a copy of it instead of creating the tables and parsing `data.sql` again.
+    """
+    app: Flask = create_app(
+        {
+            "TESTING": True,
+            "SQLALCHEMY_DATABASE_URI": IN_MEMORY_DATABASE_URI,
+        }
+    )
+    template = sqlite3.connect(":memory:", check_same_thread=False)
+    with app.app_context():
+        create_db()
+        insert_test_data()
+        with closing(db.engine.raw_connection()) as connection:
+            connection.dbapi_connection.backup(template)
+        db.engine.dispose()
+
+    yield template
+
+    template.close()
+
 
 @pytest.fixture
-def app() -> Generator[Flask, None, None]:
-    db_fp, db_path = tempfile.mkstemp()
+def app(template_db: sqlite3.Connection) -> Generator[Flask, None, None]:
     static_path: str = tempfile.mkdtemp()
     app: Flask = create_app(
         {
             "TESTING": True,
-            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{db_path}",
+            "SQLALCHEMY_DATABASE_URI": IN_MEMORY_DATABASE_URI,
             "STATIC_RESOURCE_PATH": static_path,
         }
     )
     with app.app_context():
-        create_db()
-        insert_test_data()
+        with closing(db.engine.raw_connection()) as connection:
+            template_db.backup(connection.dbapi_connection)
 
     yield app
 
-    os.close(db_fp)
-    os.unlink(db_path)
+    with app.app_context():
+        db.engine.dispose()
     shutil.rmtree(static_path)
 
 
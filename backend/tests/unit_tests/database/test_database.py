@@ -2,6 +2,12 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import pytest
+
+from database import db, migrate_db
+from models import User
+from tests.util import assert_not_raise
+
 if TYPE_CHECKING:
     from click.testing import Result
     from flask import Flask
@@ -16,3 +22,38 @@ def test_create_db_command(app: Flask) -> None:
 
     assert result.exit_code == 0
     assert result.output == "Created the database.\n"
+
+
+class TestMigrateDB:
+    @pytest.fixture
+    def user_table_without_password_scheme(self, app: Flask) -> None:
+        with app.app_context():
+            db.session.execute(db.text("ALTER TABLE user DROP COLUMN password_scheme"))
+            db.session.commit()
+
+    def test_command_should_echo_migrated(self, app: Flask) -> None:
+        with app.app_context():
+            runner: FlaskCliRunner = app.test_cli_runner()
+
+            result: Result = runner.invoke(args=("migrate-db",))
+
+        assert result.exit_code == 0
+        assert result.output == "Migrated the database.\n"
+
+    def test_on_user_table_without_password_scheme_should_add_it_as_sha512(
+        self, app: Flask, user_table_without_password_scheme: None
+    ) -> None:
+        with app.app_context():
+
+            migrate_db()
+
+            schemes: list[str] = (
+                db.session.execute(db.select(User.password_scheme)).scalars().all()
+            )
+            assert schemes and all(scheme == "sha512" for scheme in schemes)
+
+    def test_on_migrated_database_should_be_no_op(self, app: Flask) -> None:
+        with app.app_context():
+            with assert_not_raise(Exception):
+                migrate_db()
+                migrate_db()
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+
+from database import db
+from database.function import json_array_agg, json_object
+from models import Tag
+
+if TYPE_CHECKING:
+    from flask import Flask
+    from sqlalchemy.engine.interfaces import Dialect
+
+
+@pytest.mark.parametrize(
+    argnames=("dialect", "expected_sql"),
+    argvalues=(
+        (sqlite.dialect(), "json_group_array(json_object(?, tag.id))"),
+        (mysql.dialect(), "JSON_ARRAYAGG(json_object(%s, tag.id))"),
+        (
+            postgresql.dialect(),
+            "json_agg(json_build_object(%(json_object_1)s, tag.id))",
+        ),
+    ),
+)
+def test_json_functions_should_compile_to_dialect_specific_sql(
+    dialect: Dialect, expected_sql: str
+) -> None:
+    expr = json_array_agg(json_object("id", Tag.id))
+
+    assert str(expr.compile(dialect=dialect)) == expected_sql
+
+
+def test_json_array_agg_of_json_object_should_return_deserialized_list(
+    app: Flask,
+) -> None:
+    with app.app_context():
+        db.session.execute(db.insert(Tag), [{"id": 1, "name": "fruit"}])
+        db.session.commit()
+
+        tags = db.session.execute(
+            db.select(json_array_agg(json_object("id", Tag.id, "name", Tag.name)))
+        ).scalar_one()
+
+    assert tags == [{"id": 1, "name": "fruit"}]
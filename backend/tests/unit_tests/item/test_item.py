@@ -182,6 +182,29 @@ class TestPostItemsRoute:
 
         assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
 
+    @pytest.mark.parametrize(
+        argnames=("bad_tags",),
+        argvalues=(
+            (["33", 44],),  # tag id should be integer, not string.
+            (33,),  # tags should be a list.
+        ),
+    )
+    def test_with_incorrect_tags_type_payload_should_return_http_status_code_unprocessable_entity(
+        self, logged_in_client: FlaskClient, build_tags: None, bad_tags: Any
+    ) -> None:
+        payload: dict[str, Any] = {
+            "avatar": "f692073a-7ac1-11ed-a1eb-0242ac120002",
+            "count": 44,
+            "description": "Entropy is so dian.",
+            "name": "Entropy",
+            "price": {"discount": 43210, "original": 48763},
+            "tags": bad_tags,
+        }
+
+        response: TestResponse = logged_in_client.post("/items", json=payload)
+
+        assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
     def test_with_no_login_should_return_http_status_code_unauthorized(
         self, client: FlaskClient, build_tags: None
     ) -> None:
@@ -397,6 +420,26 @@ class TestPutItemsByIdRoute:
             app, 1, expected_item_payload
         )
 
+    def test_with_empty_tag_payload_should_remove_all_tags_of_item(
+        self, app: Flask, logged_in_client: FlaskClient, setup_item: None
+    ) -> None:
+        expected_item_payload: dict[str, Any] = {
+            "avatar": "xx-S0m3-aVA7aR-0f-a991e-xx",
+            "id": 1,
+            "name": "apple",
+            "count": 10,
+            "description": "This is an apple.",
+            "price": {"discount": 25, "original": 30},
+            "tags": [],
+        }
+
+        response: TestResponse = logged_in_client.put("/items/1", json={"tags": []})
+
+        assert response.status_code == HTTPStatus.OK
+        assert self.compare_item_and_excepted_item_payload_is_equal(
+            app, 1, expected_item_payload
+        )
+
     def test_with_wrong_content_type_payload_should_return_http_status_code_bad_request(
         self, logged_in_client: FlaskClient, setup_item: None
     ) -> None:
@@ -433,6 +476,23 @@ class TestPutItemsByIdRoute:
 
         assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
 
+    @pytest.mark.parametrize(
+        argnames=("bad_tags",),
+        argvalues=(
+            (["1", 2],),  # tag id should be integer, not string.
+            ("ab",),  # tags should be a list.
+            (None,),
+        ),
+    )
+    def test_with_incorrect_tags_type_payload_should_return_http_status_code_unprocessable_entity(
+        self, logged_in_client: FlaskClient, setup_item: None, bad_tags: Any
+    ) -> None:
+        response: TestResponse = logged_in_client.put(
+            "/items/1", json={"tags": bad_tags}
+        )
+
+        assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
     def test_with_incorrect_data_field_payload_should_return_http_status_code_bad_request(
         self, logged_in_client: FlaskClient, setup_item: None
     ) -> None:
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
+from item.util import PayloadTypeChecker, check_payload_type
+from tests.util import assert_not_raise
+
+
+class TestCheckPayloadType:
+    def test_on_payload_with_correct_types_should_not_raise(self) -> None:
+        payload: dict[str, Any] = {"name": "apple", "count": 10, "original": 30}
+
+        with assert_not_raise(ValidationError):
+            check_payload_type(PayloadTypeChecker.Item, payload)
+
+    def test_on_payload_with_wrong_type_should_raise_exception(self) -> None:
+        payload: dict[str, Any] = {"name": "apple", "count": "10"}
+
+        with pytest.raises(ValidationError):
+            check_payload_type(PayloadTypeChecker.Item, payload)
+
+    def test_on_tag_ids_with_wrong_type_should_raise_exception(self) -> None:
+        with pytest.raises(ValidationError):
+            check_payload_type(PayloadTypeChecker.TagIds, {"ids": [1, "2"]})
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING
 
 import pytest
 
-from static.exception import ImageNotExistError
+from static.exception import ImageNotExistError, InvalidImageContentError
 from static.util import (
     delete_image,
     get_file_path_by_image_uuid,
@@ -103,8 +103,35 @@ class TestImageManipulation:
             get_image_byte("an-absent-uuid")
 
 
-def test_verify_image_with_invalid_data_should_return_false() -> None:
-    assert not verify_image_base64_content(f"data:image/png;base64,_____________==")
+def test_verify_image_with_non_png_header_should_return_false() -> None:
+    assert not verify_image_base64_content(
+        "data:image/jpeg;base64,ZG9lc19ub3RfbWF0dGVy"
+    )
+
+
+@pytest.mark.parametrize(
+    argnames=("bad_content",),
+    argvalues=(
+        ("data:image/png;base64,_____________==",),  # invalid character
+        ("data:image/png;base64,ZG9lc19ub3RfbWF0dGVy=",),  # bad padding
+        ("data:image/png;base64,",),  # empty data
+        ("data:image/png;base64,é",),  # non-ASCII data
+    ),
+)
+def test_get_image_byte_with_invalid_base64_data_should_throw_exception(
+    bad_content: str,
+) -> None:
+    with pytest.raises(InvalidImageContentError):
+        get_image_byte_data_from_base64_content(bad_content)
+
+
+def test_get_image_byte_with_non_ascii_data_and_stdlib_decoder_should_throw_exception(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("static.util.b64decode", b64decode)  # the stdlib one
+
+    with pytest.raises(InvalidImageContentError):
+        get_image_byte_data_from_base64_content("data:image/png;base64,é")
 
 
 @pytest.mark.parametrize(
@@ -20,3 +20,11 @@ def test_get_index_should_response_content_of_index_html(client: FlaskClient) ->
     response: TestResponse = client.get("/")
 
     assert b"index.html (a marker for API test)" in response.data
+
+
+def test_jwt_codec_should_be_created_with_the_jwt_key_of_app() -> None:
+    app = create_app(
+        test_config={"TESTING": True, "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:"}
+    )
+
+    assert app.extensions["jwt_codec"].key == app.config["jwt_key"]
@@ -6,7 +6,13 @@ from typing import TYPE_CHECKING
 import pytest
 from flask import Blueprint
 
-from util import SingleMessageStatus, fetch_page, route_with_doc
+from util import (
+    PAGE_MAX_AGE,
+    SingleMessageStatus,
+    fetch_page,
+    make_cached_page_response,
+    route_with_doc,
+)
 
 if TYPE_CHECKING:
     from flask.testing import FlaskClient
@@ -20,6 +26,32 @@ def test_fetch_page(client: FlaskClient) -> None:
     assert "index.html (a marker for API test)" in page_content
 
 
+class TestMakeCachedPageResponse:
+    def test_should_respond_content_of_page(self, client: FlaskClient) -> None:
+        with client.application.app_context():
+            response = make_cached_page_response("index")
+
+        assert b"index.html (a marker for API test)" in response.data
+
+    def test_should_be_cacheable_by_browsers(self, client: FlaskClient) -> None:
+        with client.application.app_context():
+            response = make_cached_page_response("index")
+
+        assert response.cache_control.public
+        assert response.cache_control.max_age == PAGE_MAX_AGE
+
+    def test_in_debug_mode_should_not_be_cacheable_by_browsers(
+        self, client: FlaskClient
+    ) -> None:
+        client.application.debug = True
+        with client.application.app_context():
+            response = make_cached_page_response("index")
+
+        assert b"index.html (a marker for API test)" in response.data
+        assert not response.cache_control.public
+        assert response.cache_control.max_age is None
+
+
 def test_get_static_file_should_have_code_ok(client: FlaskClient) -> None:
     response: TestResponse = client.get("/static/js/index.js")
 
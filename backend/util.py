@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import TYPE_CHECKING, Final
 
 from flasgger import swag_from
 from flask import current_app, make_response
@@ -13,11 +14,34 @@ if TYPE_CHECKING:
     from flask import Blueprint, Response
 
 
+PAGE_MAX_AGE: Final[int] = 60 * 60  # in seconds
+
+
 def fetch_page(page_name: str) -> str:
     with current_app.open_resource(f"../html/{page_name}.html", mode="r") as page:
         return page.read()
 
 
+def make_cached_page_response(page_name: str) -> Response:
+    """Returns the page in a response which browsers may cache for `PAGE_MAX_AGE` seconds.
+
+    The page is read from the disk only once. In debug mode, it's instead read on every
+    request and not cached by browsers, so that edits show up without restarting the server.
+    """
+    if current_app.debug:
+        return make_response(fetch_page(page_name))
+
+    response: Response = make_response(_fetch_page_once(page_name))
+    response.cache_control.public = True
+    response.cache_control.max_age = PAGE_MAX_AGE
+    return response
+
+
+@lru_cache(maxsize=16)
+def _fetch_page_once(page_name: str) -> str:
+    return fetch_page(page_name)
+
+
 def route_with_doc(bp: Blueprint, rule: str, methods: list[str]):
     """Decorates a view function to register it with the given URL rule and methods,
     and loads the swagger specs mapped by the URL rule.